@@ -53,4 +53,6 @@ async def get_report(
 app = Litestar(route_handlers=[get_report])
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # uvloop + httptools speed up the event loop that all async injection runs on;
+    # "auto" falls back to asyncio where uvloop is unavailable (Windows)
+    uvicorn.run(app, loop="auto", http="httptools", host="0.0.0.0", port=8001)
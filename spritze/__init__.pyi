@@ -31,19 +31,28 @@ def inject(func: Callable[P, R]) -> Callable[..., R]: ...
 def provider(func: Callable[P, R]) -> Callable[P, R]: ...
 @overload
 def provider(
-    *, scope: Scope = ..., provide_as: type | None = None
+    *, scope: Scope = ..., provide_as: type | None = None, concurrent: bool = False
 ) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 @overload
 def provider(
-    target: type[T], *, scope: Scope = ..., provide_as: type | None = None
+    target: type[T],
+    *,
+    scope: Scope = ...,
+    provide_as: type | None = None,
+    concurrent: bool = False,
 ) -> Provider: ...
 @overload
 def provider(
-    target: Callable[P, R], *, scope: Scope = ..., provide_as: type | None = None
+    target: Callable[P, R],
+    *,
+    scope: Scope = ...,
+    provide_as: type | None = None,
+    concurrent: bool = False,
 ) -> Provider: ...
 def provider(
     target: Callable[P, R] | type[T] | None = None,
     *,
     scope: Scope = ...,
     provide_as: type | None = None,
+    concurrent: bool = False,
 ) -> Provider | Callable[[Callable[P, R]], Callable[P, R]] | Callable[P, R]: ...
@@ -29,10 +29,11 @@ def init(
     if context:
         container_instance._app_scoped_instances.update(context)  # pyright: ignore[reportPrivateUsage]
 
-    set_global_container(container_instance)
-
     Container._allow_instantiation = False  # pyright: ignore[reportPrivateUsage]
 
+    container_instance._warm_app_scope()  # pyright: ignore[reportPrivateUsage]
+    set_global_container(container_instance)
+
 
 def resolve(dependency_type: type[T]) -> T:
     """Synchronously resolve a dependency through the global container."""
@@ -1,68 +1,203 @@
 import inspect
-from collections.abc import Awaitable
+import sys
+from collections.abc import AsyncGenerator, Awaitable, Generator
 from functools import wraps
 from typing import Callable, ParamSpec, TypeVar, cast
 
+from spritze.internal.codegen import build_injected_wrapper
 from spritze.internal.globals import get_global_container
-from spritze.internal.type_utils import extract_dependency_from_param
+from spritze.internal.type_utils import extract_dependency_from_param, signature_of
 
 __all__ = ("inject",)
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
+_Plan = tuple[tuple[str, type[object]], ...]
+
 
 def inject(func: Callable[P, R]) -> Callable[..., R]:
     """
     Decorator for automatic dependency injection.
 
     Removes injected parameters from function signature and resolves them lazily.
+    The resolution plan is compiled once here into a wrapper specialized to the
+    function's parameters; the generic wrappers below are the fallback.
     """
-    sig = inspect.signature(func)
+    sig = signature_of(func)
 
-    params_to_inject: list[tuple[str, type[object]]] = []
-    for name, param in sig.parameters.items():
-        dependency_type = extract_dependency_from_param(param)
-        if dependency_type is not None:
-            params_to_inject.append((name, dependency_type))
+    # Interned names let keyword binding match parameters by identity
+    plan: _Plan = tuple(
+        (sys.intern(name), dependency_type)
+        for name, param in sig.parameters.items()
+        if (dependency_type := extract_dependency_from_param(param)) is not None
+    )
+    injected_names = frozenset(name for name, _ in plan)
 
     new_params = [
-        param
-        for param in sig.parameters.values()
-        if param.name not in [name for name, _ in params_to_inject]
+        param for param in sig.parameters.values() if param.name not in injected_names
     ]
     new_sig = sig.replace(parameters=new_params)
 
-    if inspect.iscoroutinefunction(func):
-
-        @wraps(func)
-        async def async_wrapper(*args: object, **kwargs: object) -> R:
-            container = get_global_container()
-
-            resolved_kwargs = dict(kwargs)
-            for name, dep_type in params_to_inject:
-                if name not in resolved_kwargs:
-                    resolved_kwargs[name] = await container.aresolve(dep_type)
-
-            result = cast(Callable[..., Awaitable[R]], func)(*args, **resolved_kwargs)
-            return await result
-
-        wrapper = async_wrapper
-    else:
-
-        @wraps(func)
-        def sync_wrapper(*args: object, **kwargs: object) -> R:
-            container = get_global_container()
+    is_async_gen = inspect.isasyncgenfunction(func)
+    is_async = is_async_gen or inspect.iscoroutinefunction(func)
+    is_generator = is_async_gen or inspect.isgeneratorfunction(func)
+    wrapper = build_injected_wrapper(
+        func,
+        sig,
+        plan,
+        get_global_container,
+        is_async=is_async,
+        is_generator=is_generator,
+    )
+    if wrapper is None:
+        if is_async_gen:
+            wrapper = _make_async_generator_wrapper(
+                cast(Callable[..., AsyncGenerator[object, object]], func), plan
+            )
+        elif is_generator:
+            wrapper = _make_generator_wrapper(
+                cast(Callable[..., Generator[object, object, object]], func), plan
+            )
+        elif is_async:
+            wrapper = _make_async_wrapper(
+                cast(Callable[..., Awaitable[object]], func), plan
+            )
+        else:
+            wrapper = _make_sync_wrapper(cast(Callable[..., object], func), plan)
 
-            resolved_kwargs = dict(kwargs)
-            for name, dep_type in params_to_inject:
-                if name not in resolved_kwargs:
-                    resolved_kwargs[name] = container.resolve(dep_type)
+    setattr(wrapper, "__signature__", new_sig)
+    return cast(Callable[..., R], wrapper)
 
-            result = cast(Callable[..., R], func)(*args, **resolved_kwargs)
-            return result
 
-        wrapper = sync_wrapper
+def _make_sync_wrapper(
+    func: Callable[..., object], plan: _Plan
+) -> Callable[..., object]:
+    """Build the generic wrapper for a synchronous function."""
+
+    # Hotpath-sensitive: runs on every call of an injected function
+    @wraps(func)
+    def sync_wrapper(*args: object, **kwargs: object) -> object:
+        container = get_global_container()
+        token = container._enter_request()  # pyright: ignore[reportPrivateUsage]
+        try:
+            for name, dep_type in plan:
+                if name not in kwargs:
+                    kwargs[name] = container.resolve(dep_type)
+
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            if token is not None:
+                container._exit_request(token, exc)  # pyright: ignore[reportPrivateUsage]
+            raise
+        if token is not None:
+            container._exit_request(token)  # pyright: ignore[reportPrivateUsage]
+        return result
+
+    return sync_wrapper
+
+
+def _make_async_wrapper(
+    func: Callable[..., Awaitable[object]], plan: _Plan
+) -> Callable[..., Awaitable[object]]:
+    """Build the generic wrapper for a coroutine function."""
+    deps = dict(plan)
+
+    # Hotpath-sensitive: runs on every call of an injected function
+    @wraps(func)
+    async def async_wrapper(*args: object, **kwargs: object) -> object:
+        container = get_global_container()
+        token = container._enter_request()  # pyright: ignore[reportPrivateUsage]
+        try:
+            if container._concurrent_names(deps) and deps.keys().isdisjoint(kwargs):  # pyright: ignore[reportPrivateUsage]
+                kwargs.update(await container._aresolve_all(deps))  # pyright: ignore[reportPrivateUsage]
+            else:
+                for name, dep_type in plan:
+                    if name not in kwargs:
+                        kwargs[name] = await container.aresolve(dep_type)
+
+            result = await func(*args, **kwargs)
+        except BaseException as exc:
+            if token is not None:
+                await container._aexit_request(token, exc)  # pyright: ignore[reportPrivateUsage]
+            raise
+        if token is not None:
+            await container._aexit_request(token)  # pyright: ignore[reportPrivateUsage]
+        return result
+
+    return async_wrapper
+
+
+def _make_generator_wrapper(
+    func: Callable[..., Generator[object, object, object]], plan: _Plan
+) -> Callable[..., Generator[object, object, object]]:
+    """Build the generic wrapper for a generator function.
+
+    The request scope is opened on the first iteration and closed once the
+    generator is exhausted, closed or fails.
+    """
 
-    setattr(wrapper, "__signature__", new_sig)
-    return cast(Callable[..., R], wrapper)
+    @wraps(func)
+    def generator_wrapper(
+        *args: object, **kwargs: object
+    ) -> Generator[object, object, object]:
+        container = get_global_container()
+        token = container._enter_request()  # pyright: ignore[reportPrivateUsage]
+        try:
+            for name, dep_type in plan:
+                if name not in kwargs:
+                    kwargs[name] = container.resolve(dep_type)
+
+            gen = func(*args, **kwargs)
+        except BaseException as exc:
+            if token is not None:
+                container._exit_request(token, exc)  # pyright: ignore[reportPrivateUsage]
+            raise
+        scope = None if token is None else container._leave_request(token)  # pyright: ignore[reportPrivateUsage]
+        try:
+            result = yield from gen
+        except BaseException as exc:
+            if scope is not None:
+                scope.close(exc)
+            raise
+        if scope is not None:
+            scope.close()
+        return result
+
+    return generator_wrapper
+
+
+def _make_async_generator_wrapper(
+    func: Callable[..., AsyncGenerator[object, object]], plan: _Plan
+) -> Callable[..., AsyncGenerator[object, object]]:
+    """Build the generic wrapper for an async generator function."""
+
+    @wraps(func)
+    async def async_generator_wrapper(
+        *args: object, **kwargs: object
+    ) -> AsyncGenerator[object, object]:
+        container = get_global_container()
+        token = container._enter_request()  # pyright: ignore[reportPrivateUsage]
+        try:
+            for name, dep_type in plan:
+                if name not in kwargs:
+                    kwargs[name] = await container.aresolve(dep_type)
+
+            gen = func(*args, **kwargs)
+        except BaseException as exc:
+            if token is not None:
+                await container._aexit_request(token, exc)  # pyright: ignore[reportPrivateUsage]
+            raise
+        scope = None if token is None else container._leave_request(token)  # pyright: ignore[reportPrivateUsage]
+        try:
+            async for item in gen:
+                yield item
+        except BaseException as exc:
+            await gen.aclose()
+            if scope is not None:
+                await scope.aclose(exc)
+            raise
+        if scope is not None:
+            await scope.aclose()
+
+    return async_generator_wrapper
@@ -29,6 +29,7 @@ def provider(
     *,
     scope: Scope = ...,
     provide_as: type[object] | None = None,
+    concurrent: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 
@@ -38,6 +39,7 @@ def provider(
     *,
     scope: Scope = ...,
     provide_as: type[object] | None = None,
+    concurrent: bool = False,
 ) -> Provider: ...
 
 
@@ -47,6 +49,7 @@ def provider(
     *,
     scope: Scope = ...,
     provide_as: type[object] | None = None,
+    concurrent: bool = False,
 ) -> Provider: ...
 
 
@@ -55,6 +58,7 @@ def provider(  # pyright: ignore[reportInconsistentOverload]
     *,
     scope: Scope = Scope.APP,
     provide_as: type[object] | None = None,
+    concurrent: bool = False,
 ) -> Provider | Callable[[Callable[P, R]], Callable[P, R]] | Callable[P, R]:
     """
     Provider decorator/factory supporting all modes:
@@ -73,6 +77,10 @@ def provider(  # pyright: ignore[reportInconsistentOverload]
         my_service = provider(
             build_service, provide_as=ServiceInterface, scope=Scope.APP
         )
+
+    With ``concurrent=True``, async resolution may await the provider in its own
+    task alongside other independent dependencies. Context variables it sets
+    are then not visible to the caller, so this is opt-in.
     """
 
     if target is None:
@@ -82,6 +90,7 @@ def provider(  # pyright: ignore[reportInconsistentOverload]
                 callable_obj=cast(Callable[..., object], func),
                 scope=scope,
                 provide_as=provide_as,
+                concurrent=concurrent,
             )
             setattr(func, PROVIDER_TAG, provider_instance)
             return func
@@ -93,6 +102,7 @@ def provider(  # pyright: ignore[reportInconsistentOverload]
             callable_obj=cast(Callable[..., object], target),
             scope=scope,
             provide_as=provide_as,
+            concurrent=concurrent,
         )
         static_method = staticmethod(target)
 
@@ -101,7 +111,10 @@ def provider(  # pyright: ignore[reportInconsistentOverload]
 
     elif isinstance(target, type):  # pyright: ignore[reportUnnecessaryIsInstance]
         provider_instance = Provider.from_callable(
-            callable_obj=target, scope=scope, provide_as=provide_as
+            callable_obj=target,
+            scope=scope,
+            provide_as=provide_as,
+            concurrent=concurrent,
         )
         setattr(target, PROVIDER_TAG, provider_instance)
         return provider_instance
@@ -1,5 +1,6 @@
 """Core container implementation."""
 
+import asyncio
 import inspect
 from collections.abc import Callable, ItemsView, Iterator
 from contextlib import (
@@ -9,12 +10,17 @@ from contextlib import (
     ExitStack,
     contextmanager,
 )
-from contextvars import ContextVar
-from typing import Final, TypeVar, cast
+from contextvars import ContextVar, Token
+from typing import Final, TypeVar, final
 
 from spritze.core.provider import Provider
 from spritze.core.type_map import TypeMap
-from spritze.exceptions import AsyncSyncMismatch, CyclicDependency, NoProviderFound
+from spritze.exceptions import (
+    AsyncSyncMismatch,
+    CyclicDependency,
+    DependsTypeMissingOrInvalid,
+    NoProviderFound,
+)
 from spritze.internal.type_utils import get_function_dependencies
 from spritze.types import Scope
 
@@ -24,6 +30,51 @@ PROVIDER_TAG: Final[str] = "__spritze_provider__"
 T = TypeVar("T")
 
 
+@final
+class _RequestScope:
+    """State of one request scope.
+
+    A fresh instance is used per request: tasks spawned by a handler keep a
+    reference to it through their copied context, so it must never be reused.
+    The cache and exit stacks are only created once something is cached or
+    entered, so calls that resolve nothing request-scoped stay cheap.
+    """
+
+    __slots__ = ("cache", "sync_stack", "async_stack")
+
+    def __init__(self) -> None:
+        self.cache: TypeMap | None = None
+        self.sync_stack: ExitStack | None = None
+        self.async_stack: AsyncExitStack | None = None
+
+    def close(self, exc: BaseException | None = None) -> None:
+        """Exit the sync context managers entered in this scope.
+
+        ``exc`` is the exception the call failed with, if any; generator
+        providers see it raised at their ``yield`` and can roll back.
+        """
+        stack = self.sync_stack
+        if stack is None:
+            return
+        if exc is None:
+            stack.close()
+        else:
+            _ = stack.__exit__(type(exc), exc, exc.__traceback__)
+
+    async def aclose(self, exc: BaseException | None = None) -> None:
+        """Exit the async, then the sync context managers entered in this scope."""
+        stack = self.async_stack
+        try:
+            if stack is None:
+                return
+            if exc is None:
+                await stack.aclose()
+            else:
+                _ = await stack.__aexit__(type(exc), exc, exc.__traceback__)
+        finally:
+            self.close(exc)
+
+
 class Container:
     """Dependency injection container."""
 
@@ -37,21 +88,28 @@ class Container:
             )
 
         self._providers: dict[type, Provider] = {}
+        # Keyed by id(provider.factory): factories live as long as the container.
+        self._factory_dependencies: dict[int, dict[str, type]] = {}
+        # Dependency closures of types that may be awaited concurrently (else None)
+        self._concurrent_closures: dict[type, frozenset[type] | None] = {}
+        # Keyed by id() of a dependency dict, pinned by the entry so ids stay unique
+        self._concurrent_groups: dict[int, tuple[dict[str, type], frozenset[str]]] = {}
 
         # Caching
         self._app_cache: TypeMap = TypeMap()
-        self._request_cache: ContextVar[TypeMap] = ContextVar(
-            "spritze_request_cache", default=TypeMap()
-        )
 
         # Context managers
         self._app_sync_stack: ExitStack = ExitStack()
         self._app_async_stack: AsyncExitStack = AsyncExitStack()
-        self._request_sync_stack: ContextVar[ExitStack] = ContextVar(
-            "spritze_request_sync_stack", default=ExitStack()
-        )
-        self._request_async_stack: ContextVar[AsyncExitStack] = ContextVar(
-            "spritze_request_async_stack", default=AsyncExitStack()
+
+        # Request scope: the ambient scope is used outside of injected calls and
+        # shared between threads, so its state is created up front
+        self._ambient_request_scope: _RequestScope = _RequestScope()
+        self._ambient_request_scope.cache = TypeMap()
+        self._ambient_request_scope.sync_stack = ExitStack()
+        self._ambient_request_scope.async_stack = AsyncExitStack()
+        self._request_scope: ContextVar[_RequestScope] = ContextVar(
+            "spritze_request_scope", default=self._ambient_request_scope
         )
 
         # Resolution tracking
@@ -60,6 +118,7 @@ class Container:
         )
 
         self._register_providers()
+        self._analyze_providers()
 
     def _register_providers(self) -> None:
         """Register providers from class definition."""
@@ -83,6 +142,7 @@ class Container:
                             bound_method,
                             scope=provider_info.scope,
                             provide_as=provider_info.provide_as,
+                            concurrent=provider_info.concurrent,
                         )
                         providers[bound_provider.provide_as] = bound_provider
                 elif isinstance(attr, staticmethod):
@@ -92,47 +152,140 @@ class Container:
 
         self._providers = providers
 
+    def _analyze_providers(self) -> None:
+        """Analyse every provider factory up front so first requests don't pay.
+
+        Invalid factories are left for resolution time, where they raise as before.
+        """
+        for provider in self._providers.values():
+            try:
+                _ = self._get_factory_dependencies(provider.factory)
+            except DependsTypeMissingOrInvalid:
+                continue
+
     @property
     def _app_scoped_instances(self) -> TypeMap:
         """Get APP-scoped instances for context initialization."""
         return self._app_cache
 
+    # Hotpath-sensitive: entered and exited around every injected call
+    def _enter_request(self) -> Token[_RequestScope] | None:
+        """Open a request scope, unless the caller already runs inside one."""
+        if self._request_scope.get() is not self._ambient_request_scope:
+            return None
+        return self._request_scope.set(_RequestScope())
+
+    def _exit_request(
+        self, token: Token[_RequestScope], exc: BaseException | None = None
+    ) -> None:
+        """Close a request scope opened by _enter_request().
+
+        ``exc`` is the exception the call failed with, if any.
+        """
+        request_scope = self._request_scope.get()
+        self._request_scope.reset(token)
+        if request_scope.sync_stack is not None:
+            request_scope.close(exc)
+
+    async def _aexit_request(
+        self, token: Token[_RequestScope], exc: BaseException | None = None
+    ) -> None:
+        """Close a request scope opened by _enter_request(), async providers too."""
+        request_scope = self._request_scope.get()
+        self._request_scope.reset(token)
+        if (
+            request_scope.sync_stack is not None
+            or request_scope.async_stack is not None
+        ):
+            await request_scope.aclose(exc)
+
+    def _leave_request(self, token: Token[_RequestScope]) -> _RequestScope:
+        """Leave a request scope opened by _enter_request() without closing it.
+
+        Generator handlers keep the scope open while they are iterated, which
+        may happen in other contexts, and close it themselves when done.
+        """
+        request_scope = self._request_scope.get()
+        self._request_scope.reset(token)
+        return request_scope
+
+    def _warm_app_scope(self) -> None:
+        """Eagerly create APP-scoped instances that can be built synchronously.
+
+        Providers that are async, depend on non-APP scopes or are part of a cycle
+        stay lazy and are resolved (or fail) on first use as before.
+        """
+        for dependency_type, provider in self._providers.items():
+            if provider.scope is Scope.APP and self._is_eager(dependency_type, ()):
+                _ = self._resolve_impl(dependency_type, sync=True)
+
+    def _is_eager(self, dependency_type: type, seen: tuple[type, ...]) -> bool:
+        """Check whether a type can be built at init from APP scope alone."""
+        if dependency_type in self._app_cache:
+            return True
+
+        provider = self._providers.get(dependency_type)
+        if (
+            provider is None
+            or provider.scope is not Scope.APP
+            or provider.is_async
+            or dependency_type in seen
+        ):
+            return False
+
+        try:
+            deps = self._get_factory_dependencies(provider.factory)
+        except DependsTypeMissingOrInvalid:
+            return False
+
+        seen = seen + (dependency_type,)
+        return all(self._is_eager(dep_type, seen) for dep_type in deps.values())
+
+    # Hotpath-sensitive: resolve/aresolve and the methods they call run once per
+    # dependency per request; avoid allocations, exceptions and repeated lookups
     def resolve(self, dependency_type: type[T]) -> T:
         """Resolve dependency synchronously."""
         result = self._resolve_impl(dependency_type, sync=True)
         if inspect.isawaitable(result):
             raise AsyncSyncMismatch(dependency_type, "synchronous")
-        return cast(T, result)
+        return result  # pyright: ignore[reportReturnType]
 
     async def aresolve(self, dependency_type: type[T]) -> T:
         """Resolve dependency asynchronously."""
-        result = await self._aresolve_impl(dependency_type)
-        return cast(T, result)
+        return await self._aresolve_impl(dependency_type)  # pyright: ignore[reportReturnType]
 
     def _get_cached(self, dependency_type: type[T]) -> T | None:
         """Check all caches for existing instance."""
-        if dependency_type in self._app_cache:
-            return self._app_cache.get(dependency_type)
-
-        request_cache = self._request_cache.get()
-        if dependency_type in request_cache:
-            return request_cache.get(dependency_type)
+        instance = self._app_cache.get(dependency_type)
+        if instance is not None:
+            return instance
 
-        return None
+        cache = self._request_scope.get().cache
+        if cache is None:
+            return None
+        return cache.get(dependency_type)
 
     def _cache_instance(
         self, dependency_type: type, instance: object, scope: Scope
-    ) -> None:
-        """Cache instance according to scope."""
+    ) -> object:
+        """Cache instance according to scope and return the cached instance.
+
+        Uses setdefault so that concurrent resolutions racing on the same type
+        agree on a single instance without taking a lock.
+        """
         match scope:
             case Scope.APP:
-                self._app_cache.set(dependency_type, instance)
+                return self._app_cache.setdefault(dependency_type, instance)
             case Scope.REQUEST:
-                self._request_cache.get().set(dependency_type, instance)
+                request_scope = self._request_scope.get()
+                cache = request_scope.cache
+                if cache is None:
+                    cache = request_scope.cache = TypeMap()
+                return cache.setdefault(dependency_type, instance)
             case Scope.TRANSIENT:
-                pass
+                return instance
             case _:
-                pass
+                return instance
 
     @contextmanager
     def _track_resolution(self, dependency_type: type) -> Iterator[None]:
@@ -150,7 +303,7 @@ class Container:
     def _get_provider(self, dependency_type: type) -> Provider:
         """Get provider for dependency type."""
         provider = self._providers.get(dependency_type)
-        if not provider:
+        if provider is None:
             raise NoProviderFound(dependency_type)
         return provider
 
@@ -166,7 +319,9 @@ class Container:
             instance = await self._acreate_instance(provider, dependencies)
 
             if not inspect.isawaitable(instance):
-                self._cache_instance(dependency_type, instance, provider.scope)
+                instance = self._cache_instance(
+                    dependency_type, instance, provider.scope
+                )
 
             return instance
 
@@ -186,25 +341,111 @@ class Container:
             instance = self._create_instance(provider, dependencies, sync)
 
             if not inspect.isawaitable(instance):
-                self._cache_instance(dependency_type, instance, provider.scope)
+                instance = self._cache_instance(
+                    dependency_type, instance, provider.scope
+                )
 
             return instance
 
     def _get_factory_dependencies(self, func: Callable[..., object]) -> dict[str, type]:
-        """Get factory dependencies."""
-        return get_function_dependencies(func, strict=True)
+        """Get factory dependencies, analysing each factory only once."""
+        deps = self._factory_dependencies.get(id(func))
+        if deps is None:
+            deps = self._factory_dependencies.setdefault(
+                id(func), get_function_dependencies(func, strict=True)
+            )
+        return deps
+
+    def _concurrent_closure(self, dependency_type: type) -> frozenset[type] | None:
+        """Get the types built when resolving a type, if it may run concurrently.
+
+        That requires an awaiting graph of providers that all opted in with
+        ``concurrent=True`` and none of which is a context manager, since those
+        are entered and exited in the caller's context. Types already in the APP
+        cache are not traversed: they are shared read-only and cannot race.
+        """
+        if dependency_type in self._concurrent_closures:
+            return self._concurrent_closures[dependency_type]
+
+        closure: set[type] = set()
+        pending = [dependency_type]
+        is_async = False
+        while pending:
+            current = pending.pop()
+            if current in closure or current in self._app_cache:
+                continue
+            closure.add(current)
+
+            provider = self._providers.get(current)
+            if provider is None:
+                continue
+            if not provider.concurrent or provider.is_context_manager:
+                is_async = False
+                break
+            is_async = is_async or provider.is_async
+            try:
+                deps = self._get_factory_dependencies(provider.factory)
+            except DependsTypeMissingOrInvalid:
+                is_async = False
+                break
+            pending.extend(deps.values())
+
+        result = frozenset(closure) if is_async else None
+        return self._concurrent_closures.setdefault(dependency_type, result)
+
+    def _concurrent_names(self, deps: dict[str, type]) -> frozenset[str]:
+        """Get the names in ``deps`` to await together, computed once per dict.
+
+        Picks dependencies whose concurrent closures share no types, so nothing
+        is built twice; empty when fewer than two qualify.
+        """
+        group = self._concurrent_groups.get(id(deps))
+        if group is not None:
+            return group[1]
+
+        names: set[str] = set()
+        claimed: set[type] = set()
+        for name, dep_type in deps.items():
+            closure = self._concurrent_closure(dep_type)
+            if closure is not None and claimed.isdisjoint(closure):
+                names.add(name)
+                claimed |= closure
+        if len(names) < 2:
+            names.clear()
+        group = (deps, frozenset(names))
+        return self._concurrent_groups.setdefault(id(deps), group)[1]
+
+    async def _aresolve_all(self, deps: dict[str, type]) -> dict[str, object]:
+        """Resolve named dependencies, awaiting independent concurrent ones together.
+
+        ``deps`` must be long-lived, such as a factory's memoized dependencies.
+        Dependencies picked by _concurrent_names() are resolved with
+        asyncio.gather after the rest, which are awaited one by one in the
+        caller's context.
+        """
+        concurrent = self._concurrent_names(deps)
+        dependencies: dict[str, object] = {}
+        for name, dep_type in deps.items():
+            if name not in concurrent:
+                dependencies[name] = await self._aresolve_impl(dep_type)
+
+        if concurrent:
+            results = await asyncio.gather(
+                *(self._aresolve_impl(deps[name]) for name in concurrent),
+                return_exceptions=True,
+            )
+            for name, result in zip(concurrent, results):
+                if isinstance(result, BaseException):
+                    raise result
+                dependencies[name] = result
+
+        return dependencies
 
     async def _aresolve_dependencies(
         self, func: Callable[..., object]
     ) -> dict[str, object]:
         """Resolve dependencies asynchronously."""
-        deps_to_resolve = self._get_factory_dependencies(func)
-        dependencies: dict[str, object] = {}
-
-        for name, dep_type in deps_to_resolve.items():
-            dependencies[name] = await self.aresolve(dep_type)
-
-        return dependencies
+        return await self._aresolve_all(self._get_factory_dependencies(func))
 
     def _resolve_dependencies(
         self, func: Callable[..., object], sync: bool
@@ -229,11 +470,14 @@ class Container:
             case Scope.APP:
                 return self._app_async_stack if is_async else self._app_sync_stack
             case Scope.REQUEST | Scope.TRANSIENT:
-                return (
-                    self._request_async_stack.get()
-                    if is_async
-                    else self._request_sync_stack.get()
-                )
+                request_scope = self._request_scope.get()
+                if is_async:
+                    if request_scope.async_stack is None:
+                        request_scope.async_stack = AsyncExitStack()
+                    return request_scope.async_stack
+                if request_scope.sync_stack is None:
+                    request_scope.sync_stack = ExitStack()
+                return request_scope.sync_stack
             case _:
                 raise ValueError(f"Unknown scope: {scope}")
 
@@ -241,27 +485,22 @@ class Container:
         self, provider: Provider, dependencies: dict[str, object]
     ) -> object:
         """Create instance from sync context manager."""
-        stack = cast(ExitStack, self._get_stack(provider.scope, False))
-        raw_cm = provider.factory(**dependencies)
-        cm = cast(AbstractContextManager[object], raw_cm)
-        instance = stack.enter_context(cm)
-        self._cache_instance(provider.provide_as, instance, provider.scope)
-        return instance
+        stack = self._get_stack(provider.scope, False)
+        cm: AbstractContextManager[object] = provider.factory(**dependencies)  # pyright: ignore[reportAssignmentType]
+        return stack.enter_context(cm)
 
     async def _acreate_async_cm_instance(
         self, provider: Provider, dependencies: dict[str, object]
     ) -> object:
         """Create instance from async context manager."""
-        stack = cast(AsyncExitStack, self._get_stack(provider.scope, True))
+        stack: AsyncExitStack = self._get_stack(provider.scope, True)  # pyright: ignore[reportAssignmentType]
         raw_acm = provider.factory(**dependencies)
 
         if inspect.iscoroutine(raw_acm):
-            raw_acm = cast(AbstractAsyncContextManager[object], await raw_acm)
+            raw_acm = await raw_acm  # pyright: ignore[reportAny]
 
-        acm = cast(AbstractAsyncContextManager[object], raw_acm)
-        instance = await stack.enter_async_context(acm)
-        self._cache_instance(provider.provide_as, instance, provider.scope)
-        return instance
+        acm: AbstractAsyncContextManager[object] = raw_acm  # pyright: ignore[reportAssignmentType]
+        return await stack.enter_async_context(acm)
 
     async def _acreate_instance(
         self, provider: Provider, dependencies: dict[str, object]
@@ -270,7 +509,7 @@ class Container:
         if not provider.is_context_manager:
             result = provider.factory(**dependencies)
             if inspect.iscoroutine(result):
-                result = cast(object, await result)
+                return await result  # pyright: ignore[reportAny]
             return result
 
         if provider.is_async:
@@ -6,9 +6,13 @@ from collections.abc import Callable
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import NoReturn, get_type_hints
+from typing import NoReturn
 
-from spritze.internal.type_utils import get_function_dependencies, unwrap_type
+from spritze.internal.type_utils import (
+    get_function_dependencies,
+    type_hints_of,
+    unwrap_type,
+)
 from spritze.types import ProviderType, Scope
 
 __all__ = ("Provider",)
@@ -22,6 +26,7 @@ class Provider:
     scope: Scope
     provide_as: type
     provider_type: ProviderType
+    concurrent: bool = False
     _dependencies: dict[str, type] | None = None
 
     def __init__(self) -> NoReturn:
@@ -34,6 +39,7 @@ class Provider:
         *,
         scope: Scope,
         provide_as: type | None = None,
+        concurrent: bool = False,
     ) -> "Provider":
         """Create provider from callable."""
         if isinstance(callable_obj, staticmethod):
@@ -73,6 +79,7 @@ class Provider:
         object.__setattr__(self, "scope", scope)
         object.__setattr__(self, "provide_as", provide_as)
         object.__setattr__(self, "provider_type", provider_type)
+        object.__setattr__(self, "concurrent", concurrent)
         # Cache dependencies analysis
         deps = cls._analyze_dependencies(factory)
         object.__setattr__(self, "_dependencies", deps)
@@ -116,7 +123,7 @@ class Provider:
     def _extract_return_type(func: Callable[..., object]) -> type:
         """Extract return type from callable."""
         try:
-            hints = get_type_hints(func, include_extras=True)
+            hints = type_hints_of(func)
         except Exception as e:
             raise TypeError(
                 f"Failed to resolve type hints for {func.__name__}: {e}"
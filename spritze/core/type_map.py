@@ -39,10 +39,11 @@ class TypeMap(TypeMapProto):
     @override
     def get(self, t: type[T]) -> T | None:
         """Retrieve a value for a given type."""
-        v = self._store.get(t)
-        if v is None:
-            return None
-        return cast(T, v)
+        return self._store.get(t)  # pyright: ignore[reportReturnType]
+
+    def setdefault(self, t: type[T], value: T) -> T:
+        """Store a value unless one exists; return the stored value."""
+        return self._store.setdefault(t, value)  # pyright: ignore[reportReturnType]
 
     @override
     def pop(self, t: type[T]) -> T | None:
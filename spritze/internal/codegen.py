@@ -0,0 +1,230 @@
+"""Source generation for injection wrappers specialized to one function."""
+
+import inspect
+from collections.abc import Callable
+from functools import update_wrapper
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from spritze.core.container import Container
+
+__all__ = ("build_injected_wrapper",)
+
+_PREFIX = "_spritze_"
+_MISSING = object()
+
+
+def build_injected_wrapper(
+    func: Callable[..., object],
+    sig: inspect.Signature,
+    plan: tuple[tuple[str, type[object]], ...],
+    get_container: Callable[[], "Container"],
+    *,
+    is_async: bool,
+    is_generator: bool = False,
+) -> Callable[..., object] | None:
+    """Generate a wrapper with ``func``'s exact parameters and inlined resolution.
+
+    Injected parameters become keyword-only arguments defaulting to a sentinel,
+    so callers can still pass them explicitly. Each call runs in a request scope
+    of the container (shared with an enclosing injected call, if any); for
+    generator functions the scope spans the iteration instead. Async functions
+    with several dependencies await providers marked ``concurrent`` together
+    when the container finds them independent. Returns None when the signature
+    cannot be expressed this way and the generic wrapper must be used instead.
+    """
+    injected = {name: index for index, (name, _) in enumerate(plan)}
+    has_var_positional = any(
+        param.kind is inspect.Parameter.VAR_POSITIONAL
+        for param in sig.parameters.values()
+    )
+
+    if is_async:
+        resolver, exit_request, await_ = "aresolve", "_aexit_request", "await "
+    else:
+        resolver, exit_request, await_ = "resolve", "_exit_request", ""
+    batch = is_async and not is_generator and len(plan) > 1
+    # Binding the resolver to a local only pays off for several dependencies
+    bind_resolver = not batch and len(plan) > 1
+    resolve = f"{_PREFIX}resolve" if bind_resolver else f"{_PREFIX}c.{resolver}"
+
+    namespace: dict[str, object] = {
+        f"{_PREFIX}func": func,
+        f"{_PREFIX}get_container": get_container,
+        f"{_PREFIX}missing": _MISSING,
+        f"{_PREFIX}deps": dict(plan),
+    }
+    pos_only: list[str] = []
+    pos_or_kw: list[str] = []
+    var_pos: str | None = None
+    kw_only: list[str] = []
+    var_kw: str | None = None
+    call_args: list[str] = []
+
+    for position, (name, param) in enumerate(sig.parameters.items()):
+        if name.startswith(_PREFIX):
+            return None
+
+        if name in injected:
+            if param.kind is inspect.Parameter.POSITIONAL_ONLY or (
+                param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+                and has_var_positional
+            ):
+                return None
+            index = injected[name]
+            namespace[f"{_PREFIX}t{index}"] = plan[index][1]
+            kw_only.append(f"{name}={_PREFIX}missing")
+            if batch:
+                # Resolved ahead of the call, see below
+                call_args.append(f"{name}={name}")
+                continue
+            resolved = f"{resolve}({_PREFIX}t{index})"
+            if is_async:
+                resolved = f"await {resolved}"
+            call_args.append(
+                f"{name}=({resolved} if {name} is {_PREFIX}missing else {name})"
+            )
+            continue
+
+        rendered = name
+        if param.default is not inspect.Parameter.empty:  # pyright: ignore[reportAny]
+            namespace[f"{_PREFIX}d{position}"] = param.default  # pyright: ignore[reportAny]
+            rendered = f"{name}={_PREFIX}d{position}"
+
+        match param.kind:
+            case inspect.Parameter.POSITIONAL_ONLY:
+                pos_only.append(rendered)
+                call_args.append(name)
+            case inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                pos_or_kw.append(rendered)
+                call_args.append(name if has_var_positional else f"{name}={name}")
+            case inspect.Parameter.VAR_POSITIONAL:
+                var_pos = name
+                call_args.append(f"*{name}")
+            case inspect.Parameter.KEYWORD_ONLY:
+                kw_only.append(rendered)
+                call_args.append(f"{name}={name}")
+            case inspect.Parameter.VAR_KEYWORD:
+                var_kw = name
+                call_args.append(f"**{name}")
+
+    params: list[str] = [*pos_only]
+    if pos_only:
+        params.append("/")
+    params.extend(pos_or_kw)
+    if var_pos is not None:
+        params.append(f"*{var_pos}")
+    elif kw_only:
+        params.append("*")
+    params.extend(kw_only)
+    if var_kw is not None:
+        params.append(f"**{var_kw}")
+
+    # Hotpath-sensitive: the generated body runs on every injected call; keep it
+    # free of per-call allocations beyond the call itself
+    call = f"{_PREFIX}func({', '.join(call_args)})"
+    header = f"{'async ' if is_async else ''}def {_PREFIX}wrapper({', '.join(params)}):"
+    if not plan and not is_generator:
+        # Nothing to resolve, so there is no request scope to manage either
+        lines = [header, f"    return {await_}{call}"]
+        return _compile_wrapper(func, lines, namespace)
+
+    lines = [header, f"    {_PREFIX}c = {_PREFIX}get_container()"]
+    if bind_resolver:
+        lines.append(f"    {_PREFIX}resolve = {_PREFIX}c.{resolver}")
+    lines += [
+        f"    {_PREFIX}token = {_PREFIX}c._enter_request()",
+        "    try:",
+    ]
+    if is_generator:
+        lines += _generator_body(call, exit_request, is_async=is_async)
+        return _compile_wrapper(func, lines, namespace)
+    if batch:
+        # Await together only if the container found at least two independent
+        # concurrent dependencies in the plan; otherwise await one by one
+        all_missing = " and ".join(f"{name} is {_PREFIX}missing" for name, _ in plan)
+        container, deps = f"{_PREFIX}c", f"{_PREFIX}deps"
+        lines += [
+            f"        if {all_missing} and {container}._concurrent_names({deps}):",
+            f"            {_PREFIX}resolved = await {container}._aresolve_all({deps})",
+        ]
+        lines += [
+            f"            {name} = {_PREFIX}resolved[{name!r}]" for name, _ in plan
+        ]
+        lines.append("        else:")
+        for index, (name, _) in enumerate(plan):
+            lines += [
+                f"            if {name} is {_PREFIX}missing:",
+                f"                {name} = await {resolve}({_PREFIX}t{index})",
+            ]
+    # The scope is closed with the call's exception, if any, so that generator
+    # providers can tell a failed call from a successful one
+    lines += [
+        f"        {_PREFIX}result = {await_}{call}",
+        f"    except BaseException as {_PREFIX}exc:",
+        f"        if {_PREFIX}token is not None:",
+        f"            {await_}{_PREFIX}c.{exit_request}({_PREFIX}token, {_PREFIX}exc)",
+        "        raise",
+        f"    if {_PREFIX}token is not None:",
+        f"        {await_}{_PREFIX}c.{exit_request}({_PREFIX}token)",
+        f"    return {_PREFIX}result",
+    ]
+    return _compile_wrapper(func, lines, namespace)
+
+
+def _generator_body(call: str, exit_request: str, *, is_async: bool) -> list[str]:
+    """Generate the body of a wrapper that iterates a generator in its scope.
+
+    The wrapper is a generator itself, so the scope is opened on the first
+    iteration. It is left right after the dependencies are resolved, since the
+    iteration may be resumed from other contexts, and closed once the generator
+    is exhausted, closed or fails.
+    """
+    await_ = "await " if is_async else ""
+    lines = [
+        f"        {_PREFIX}gen = {call}",
+        f"    except BaseException as {_PREFIX}exc:",
+        f"        if {_PREFIX}token is not None:",
+        f"            {await_}{_PREFIX}c.{exit_request}({_PREFIX}token, {_PREFIX}exc)",
+        "        raise",
+        f"    {_PREFIX}scope = (",
+        f"        None if {_PREFIX}token is None",
+        f"        else {_PREFIX}c._leave_request({_PREFIX}token)",
+        "    )",
+        "    try:",
+    ]
+    if is_async:
+        lines += [
+            f"        async for {_PREFIX}item in {_PREFIX}gen:",
+            f"            yield {_PREFIX}item",
+            f"    except BaseException as {_PREFIX}exc:",
+            f"        await {_PREFIX}gen.aclose()",
+            f"        if {_PREFIX}scope is not None:",
+            f"            await {_PREFIX}scope.aclose({_PREFIX}exc)",
+            "        raise",
+            f"    if {_PREFIX}scope is not None:",
+            f"        await {_PREFIX}scope.aclose()",
+        ]
+    else:
+        lines += [
+            f"        {_PREFIX}result = yield from {_PREFIX}gen",
+            f"    except BaseException as {_PREFIX}exc:",
+            f"        if {_PREFIX}scope is not None:",
+            f"            {_PREFIX}scope.close({_PREFIX}exc)",
+            "        raise",
+            f"    if {_PREFIX}scope is not None:",
+            f"        {_PREFIX}scope.close()",
+            f"    return {_PREFIX}result",
+        ]
+    return lines
+
+
+def _compile_wrapper(
+    func: Callable[..., object], lines: list[str], namespace: dict[str, object]
+) -> Callable[..., object]:
+    """Execute the generated source and return the wrapper it defines."""
+    code = compile("\n".join(lines), f"<spritze inject {func.__qualname__}>", "exec")
+    exec(code, namespace)
+
+    wrapper = cast(Callable[..., object], namespace[f"{_PREFIX}wrapper"])
+    return update_wrapper(wrapper, func)
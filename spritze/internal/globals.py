@@ -1,4 +1,9 @@
-"""Global container management for dependency injection."""
+"""Global container management for dependency injection.
+
+The container is a plain module global on purpose: it is set once by init()
+and must be visible from every thread and task, while reads stay lock-free.
+Per-request state lives in the container's request-scope ContextVar instead.
+"""
 
 from typing import TYPE_CHECKING
 
@@ -15,6 +20,7 @@ __all__ = (
 _global_container: "Container | None" = None
 
 
+# Hotpath-sensitive: called once per injected call
 def get_global_container() -> "Container":
     """Get the global container instance."""
     container = _global_container
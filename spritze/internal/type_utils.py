@@ -1,12 +1,73 @@
 """Type annotation utilities."""
 
 import inspect
-from typing import Annotated, Callable, cast, get_args, get_origin
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Callable,
+    ForwardRef,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from spritze.exceptions import DependsTypeMissingOrInvalid
 from spritze.types import Depends
 
-__all__ = ("unwrap_type", "extract_dependency_from_param", "get_function_dependencies")
+__all__ = (
+    "unwrap_type",
+    "extract_dependency_from_param",
+    "get_function_dependencies",
+    "signature_of",
+    "type_hints_of",
+)
+
+
+@lru_cache(maxsize=1024)
+def _cached_signature(func: Callable[..., object]) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=1024)
+def _cached_type_hints(func: Callable[..., object]) -> dict[str, object]:
+    return get_type_hints(func, include_extras=True)
+
+
+def signature_of(func: Callable[..., object]) -> inspect.Signature:
+    """Get the signature of a callable, cached per callable."""
+    try:
+        return _cached_signature(func)
+    except TypeError:
+        # Unhashable callables cannot be cached
+        return inspect.signature(func)
+
+
+def _is_concrete(annotation: object) -> bool:
+    """Check that an annotation needs no evaluation by get_type_hints()."""
+    if annotation is None or isinstance(annotation, (str, ForwardRef)):
+        return False
+    args: tuple[object, ...] = get_args(annotation)
+    return all(_is_concrete(arg) for arg in args)
+
+
+def type_hints_of(func: Callable[..., object]) -> dict[str, object]:
+    """Get resolved type hints (with extras) of a callable, cached per callable.
+
+    Functions whose annotations are already concrete (no strings, forward
+    references or None) skip get_type_hints() and its eval() entirely.
+    The returned mapping is shared and must not be mutated.
+    """
+    if inspect.isfunction(func) or inspect.ismethod(func):
+        annotations: dict[str, object] = func.__annotations__
+        if all(_is_concrete(annotation) for annotation in annotations.values()):
+            return annotations
+
+    try:
+        return _cached_type_hints(func)
+    except TypeError:
+        # Unhashable callables cannot be cached
+        return get_type_hints(func, include_extras=True)
 
 
 def unwrap_type(rt: object) -> type:
@@ -70,22 +131,15 @@ def extract_dependency_from_param(param: inspect.Parameter) -> type | None:
                 f"Parameter '{param.name}' missing dependency type"
             )
 
-    # Annotated[Type, Depends()] usage
-    if annotation is not inspect.Parameter.empty:
-        origin = get_origin(annotation)  # pyright: ignore[reportAny]
-        if origin is not None:
-            origin_name = getattr(origin, "__name__", None)  # pyright: ignore[reportAny]
-            if origin_name == "Annotated":
-                args: tuple[type, ...] = get_args(annotation)
-                if len(args) >= 2:
-                    actual_type = args[0]
-                    metadata = args[1:]
-                    for meta in metadata:
-                        if isinstance(meta, Depends):
-                            if meta.dependency_type is not None:
-                                return meta.dependency_type
-                            else:
-                                return actual_type
+    # Annotated[Type, Depends()] usage; read Annotated's public attributes
+    # directly instead of building tuples through get_origin()/get_args()
+    metadata: object = getattr(annotation, "__metadata__", None)  # pyright: ignore[reportAny]
+    if isinstance(metadata, tuple):
+        for meta in cast(tuple[object, ...], metadata):
+            if isinstance(meta, Depends):
+                if meta.dependency_type is not None:
+                    return meta.dependency_type
+                return annotation.__origin__  # pyright: ignore[reportAny]
 
     return None
 
@@ -103,7 +157,7 @@ def get_function_dependencies(
         Dict mapping parameter names to their types
     """
     try:
-        sig = inspect.signature(func)
+        sig = signature_of(func)
     except (ValueError, TypeError):
         return {}
 
@@ -125,8 +179,6 @@ def get_function_dependencies(
 
         if annotation is inspect.Parameter.empty:
             if strict:
-                from spritze.exceptions import DependsTypeMissingOrInvalid
-
                 raise DependsTypeMissingOrInvalid(
                     f"Parameter '{name}' has invalid type annotation"
                 )
@@ -136,8 +188,6 @@ def get_function_dependencies(
             not isinstance(annotation, type) and get_origin(annotation) is None  # pyright: ignore[reportAny]
         ):
             if strict:
-                from spritze.exceptions import DependsTypeMissingOrInvalid
-
                 raise DependsTypeMissingOrInvalid(
                     f"Parameter '{name}' has invalid type annotation"
                 )
@@ -0,0 +1,113 @@
+"""Allocation budget of the injection hot path.
+
+Injection is CPU-bound on interpreter overhead, so these tests guard against
+per-call allocations that outlive the call (leaks) or pile up within it.
+"""
+
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterable
+from typing import Annotated
+
+from spritze import Container, Depends, Scope, init, inject, provider
+
+CALLS = 10_000
+
+
+class Settings:
+    pass
+
+
+class Resource:
+    def __init__(self, settings: Settings) -> None:
+        self.settings: Settings = settings
+
+
+class Service:
+    def __init__(self, settings: Settings, resource: Resource) -> None:
+        self.settings: Settings = settings
+        self.resource: Resource = resource
+
+
+class AllocationContainer(Container):
+    settings: object = provider(Settings, scope=Scope.APP)
+
+    @provider(scope=Scope.REQUEST)
+    def resource(self, settings: Settings) -> Iterable[Resource]:
+        yield Resource(settings)
+
+    service: object = provider(Service, scope=Scope.REQUEST)
+
+
+def _make_handler() -> Callable[..., int]:
+    init(AllocationContainer)
+
+    @inject
+    def handler(
+        user_id: int,
+        service: Annotated[Service, Depends()],
+        settings: Annotated[Settings, Depends()],
+    ) -> int:
+        assert service.settings is settings
+        return user_id
+
+    for i in range(100):
+        _ = handler(i)
+    return handler
+
+
+def test_injected_calls_do_not_retain_memory() -> None:
+    handler = _make_handler()
+
+    _ = gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    for i in range(CALLS):
+        _ = handler(i)
+    _ = gc.collect()
+
+    assert sys.getallocatedblocks() - blocks_before < CALLS // 10
+
+
+def test_injected_call_peak_memory() -> None:
+    handler = _make_handler()
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for i in range(CALLS):
+            _ = handler(i)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert current - baseline < 16 * 1024
+    assert peak - baseline < 64 * 1024
+
+
+def _call_peak(handler: Callable[..., int], user_id: int) -> int:
+    """Bytes held at once during a single call, including those freed by its end."""
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    _ = handler(user_id)
+    _, peak = tracemalloc.get_traced_memory()
+    return peak - current
+
+
+def test_app_scoped_call_allocations() -> None:
+    init(AllocationContainer)
+
+    @inject
+    def handler(user_id: int, settings: Annotated[Settings, Depends()]) -> int:
+        assert isinstance(settings, Settings)
+        return user_id
+
+    _ = handler(0)
+    tracemalloc.start()
+    try:
+        peak = min(_call_peak(handler, i) for i in range(10))
+    finally:
+        tracemalloc.stop()
+
+    # Only the request scope marker, no cache or exit stacks
+    assert peak < 512
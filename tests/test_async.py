@@ -1,8 +1,13 @@
 """Tests for async functionality."""
 
+import asyncio
+from collections.abc import AsyncIterable
+from contextvars import ContextVar
+from typing import Annotated
+
 import pytest
 
-from spritze import Container, Scope, aresolve, init, provider
+from spritze import Container, Depends, Scope, aresolve, init, inject, provider
 from spritze.exceptions import AsyncSyncMismatch
 
 
@@ -96,3 +101,182 @@ class TestAsync:
         service = await aresolve(SyncService)
         assert isinstance(service, SyncService)
         assert service.value == "sync"
+
+    @pytest.mark.asyncio
+    async def test_background_task_keeps_its_request_scope(self) -> None:
+        """Test that a task outliving its request never sees the next request."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            def sync_service(self) -> SyncService:
+                return SyncService()
+
+        init(TestContainer)
+
+        tasks: list[asyncio.Task[SyncService]] = []
+
+        async def background() -> SyncService:
+            await asyncio.sleep(0)
+            return await aresolve(SyncService)
+
+        @inject
+        async def handler(
+            service: Annotated[SyncService, Depends()],
+        ) -> SyncService:
+            tasks.append(asyncio.create_task(background()))
+            return service
+
+        first = await handler()
+        second = await handler()
+
+        assert first is not second
+        assert await tasks[0] is first
+        assert await tasks[1] is second
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_isolated(self) -> None:
+        """Test that concurrently running handlers get separate request scopes."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            def sync_service(self) -> SyncService:
+                return SyncService()
+
+        init(TestContainer)
+
+        @inject
+        async def handler(
+            service: Annotated[SyncService, Depends()],
+        ) -> SyncService:
+            await asyncio.sleep(0)
+            assert await aresolve(SyncService) is service
+            return service
+
+        first, second = await asyncio.gather(handler(), handler())
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_independent_async_dependencies_run_concurrently(self) -> None:
+        """Test that independent concurrent providers are awaited together."""
+
+        class Cache:
+            pass
+
+        class Aggregate:
+            def __init__(self, service: AsyncService, cache: Cache) -> None:
+                self.service: AsyncService = service
+                self.cache: Cache = cache
+
+        running: list[int] = [0, 0]
+
+        async def track() -> None:
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST, concurrent=True)
+            async def async_service(self, _: SyncService) -> AsyncService:
+                await track()
+                return await AsyncService.create()
+
+            @provider(scope=Scope.REQUEST, concurrent=True)
+            async def cache(self, _: SyncService) -> Cache:
+                await track()
+                return Cache()
+
+            @provider(scope=Scope.APP)
+            def sync_service(self) -> SyncService:
+                return SyncService()
+
+            aggregate: object = provider(Aggregate, scope=Scope.REQUEST)
+
+        init(TestContainer)
+
+        @inject
+        async def handler(
+            service: Annotated[AsyncService, Depends()],
+            cache: Annotated[Cache, Depends()],
+        ) -> tuple[AsyncService, Cache]:
+            return service, cache
+
+        service, cache = await handler()
+        assert isinstance(service, AsyncService)
+        assert isinstance(cache, Cache)
+        assert running == [0, 2]
+
+        own_cache = Cache()
+        assert (await handler(cache=own_cache))[1] is own_cache
+
+        running[1] = 0
+        aggregate = await aresolve(Aggregate)
+        assert isinstance(aggregate.service, AsyncService)
+        assert running == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_async_providers_run_in_callers_context(self) -> None:
+        """Test that context variables set by async providers reach the handler."""
+        tenant: ContextVar[str | None] = ContextVar("tenant", default=None)
+
+        class Cache:
+            pass
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            async def async_service(self) -> AsyncService:
+                _ = tenant.set("t1")
+                return await AsyncService.create()
+
+            @provider(scope=Scope.REQUEST)
+            async def cache(self) -> Cache:
+                return Cache()
+
+        init(TestContainer)
+
+        @inject
+        async def one(service: Annotated[AsyncService, Depends()]) -> str | None:
+            return tenant.get()
+
+        @inject
+        async def two(
+            service: Annotated[AsyncService, Depends()],
+            cache: Annotated[Cache, Depends()],
+        ) -> str | None:
+            return tenant.get()
+
+        assert await asyncio.create_task(one()) == "t1"
+        assert await asyncio.create_task(two()) == "t1"
+
+    @pytest.mark.asyncio
+    async def test_context_manager_providers_run_in_callers_context(self) -> None:
+        """Test that context manager providers are not resolved in child tasks."""
+        current: ContextVar[str | None] = ContextVar("current", default=None)
+
+        class Session:
+            pass
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            async def session(self) -> AsyncIterable[Session]:
+                token = current.set("session")
+                try:
+                    yield Session()
+                finally:
+                    current.reset(token)
+
+            @provider(scope=Scope.REQUEST)
+            async def async_service(self) -> AsyncService:
+                return await AsyncService.create()
+
+        init(TestContainer)
+
+        @inject
+        async def handler(
+            session: Annotated[Session, Depends()],
+            service: Annotated[AsyncService, Depends()],
+        ) -> str | None:
+            return current.get()
+
+        assert await handler() == "session"
+        assert current.get() is None
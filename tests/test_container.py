@@ -181,3 +181,27 @@ class TestContainer:
 
         assert resolve(ServiceA) is not None
         assert resolve(ServiceB) is not None
+
+    def test_app_scope_is_warmed_on_init(self) -> None:
+        """Test that sync APP providers are built by init(), others stay lazy."""
+
+        created: list[type] = []
+
+        class TestContainer(Container):
+            @provider(scope=Scope.APP)
+            def simple_service(self) -> SimpleService:
+                created.append(SimpleService)
+                return SimpleService()
+
+            @provider(scope=Scope.REQUEST)
+            def dependent_service(self, simple: SimpleService) -> DependentService:
+                created.append(DependentService)
+                return DependentService(simple)
+
+        init(TestContainer)
+
+        assert created == [SimpleService]
+
+        dependent = resolve(DependentService)
+        assert dependent.simple is resolve(SimpleService)
+        assert created == [SimpleService, DependentService]
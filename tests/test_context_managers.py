@@ -1,10 +1,20 @@
 """Tests for context manager providers."""
 
-from collections.abc import AsyncIterable, Iterable
+from collections.abc import AsyncIterable, Generator, Iterable
+from typing import Annotated
 
 import pytest
 
-from spritze import Container, Scope, aresolve, init, provider, resolve
+from spritze import (
+    Container,
+    Depends,
+    Scope,
+    aresolve,
+    init,
+    inject,
+    provider,
+    resolve,
+)
 
 
 class Resource:
@@ -125,3 +135,240 @@ class TestContextManagers:
 
         resource = await aresolve(AsyncResource)
         assert not resource.closed
+
+
+class TestRequestScope:
+    def test_injected_call_closes_request_scope(self) -> None:
+        """Test that each injected call gets its own request scope."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            def resource(self) -> Iterable[Resource]:
+                res = Resource()
+                try:
+                    yield res
+                finally:
+                    res.close()
+
+        init(TestContainer)
+
+        @inject
+        def inner(resource: Annotated[Resource, Depends()]) -> Resource:
+            return resource
+
+        @inject
+        def handler(resource: Annotated[Resource, Depends()]) -> Resource:
+            assert inner() is resource
+            assert not resource.closed
+            return resource
+
+        first = handler()
+        second = handler()
+
+        assert first.closed
+        assert second.closed
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_async_injected_call_closes_request_scope(self) -> None:
+        """Test that async context managers are closed after an injected call."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            async def async_resource(self) -> AsyncIterable[AsyncResource]:
+                res = AsyncResource()
+                try:
+                    yield res
+                finally:
+                    await res.aclose()
+
+        init(TestContainer)
+
+        @inject
+        async def handler(
+            resource: Annotated[AsyncResource, Depends()],
+        ) -> AsyncResource:
+            assert not resource.closed
+            return resource
+
+        resource = await handler()
+        assert resource.closed
+
+    def test_failed_call_rolls_back_request_scope(self) -> None:
+        """Test that generator providers see the exception of a failed call."""
+        events: list[str] = []
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            def resource(self) -> Iterable[Resource]:
+                try:
+                    yield Resource()
+                except ValueError:
+                    events.append("rollback")
+                    raise
+                else:
+                    events.append("commit")
+
+        init(TestContainer)
+
+        @inject
+        def handler(fail: bool, resource: Annotated[Resource, Depends()]) -> None:
+            if fail:
+                raise ValueError("handler failed")
+
+        handler(False)
+        with pytest.raises(ValueError, match="handler failed"):
+            handler(True)
+
+        assert events == ["commit", "rollback"]
+
+    @pytest.mark.asyncio
+    async def test_failed_async_call_rolls_back_request_scope(self) -> None:
+        """Test that async generator providers see the exception of a failed call."""
+        events: list[str] = []
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            async def async_resource(self) -> AsyncIterable[AsyncResource]:
+                try:
+                    yield AsyncResource()
+                except ValueError:
+                    events.append("rollback")
+                    raise
+                else:
+                    events.append("commit")
+
+        init(TestContainer)
+
+        @inject
+        async def handler(
+            fail: bool, resource: Annotated[AsyncResource, Depends()]
+        ) -> None:
+            if fail:
+                raise ValueError("handler failed")
+
+        await handler(False)
+        with pytest.raises(ValueError, match="handler failed"):
+            await handler(True)
+
+        assert events == ["commit", "rollback"]
+
+    def test_generator_handler_closes_request_scope(self) -> None:
+        """Test that a generator handler's scope spans its iteration."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            def resource(self) -> Iterable[Resource]:
+                res = Resource()
+                try:
+                    yield res
+                finally:
+                    res.close()
+
+        init(TestContainer)
+
+        @inject
+        def stream(
+            resource: Annotated[Resource, Depends()],
+        ) -> Generator[Resource, None, None]:
+            assert not resource.closed
+            yield resource
+            assert not resource.closed
+
+        [first] = list(stream())
+        [second] = list(stream())
+
+        assert first is not second
+        assert first.closed
+        assert second.closed
+
+        unfinished = stream()
+        resource = next(unfinished)
+        assert not resource.closed
+        unfinished.close()
+        assert resource.closed
+
+    @pytest.mark.asyncio
+    async def test_async_generator_handler_closes_request_scope(self) -> None:
+        """Test that an async generator handler's scope spans its iteration."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            async def async_resource(self) -> AsyncIterable[AsyncResource]:
+                res = AsyncResource()
+                try:
+                    yield res
+                finally:
+                    await res.aclose()
+
+        init(TestContainer)
+
+        @inject
+        async def stream(
+            resource: Annotated[AsyncResource, Depends()],
+        ) -> AsyncIterable[AsyncResource]:
+            assert not resource.closed
+            yield resource
+            assert not resource.closed
+
+        [first] = [resource async for resource in stream()]
+        [second] = [resource async for resource in stream()]
+
+        assert first is not second
+        assert first.closed
+        assert second.closed
+
+    def test_generic_generator_wrapper_closes_request_scope(self) -> None:
+        """Test the fallback wrapper of generator handlers."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            def resource(self) -> Iterable[Resource]:
+                res = Resource()
+                try:
+                    yield res
+                finally:
+                    res.close()
+
+        init(TestContainer)
+
+        @inject
+        def stream(
+            _spritze_n: int, resource: Annotated[Resource, Depends()]
+        ) -> Iterable[Resource]:
+            for _ in range(_spritze_n):
+                assert not resource.closed
+                yield resource
+
+        first, again = stream(2)
+        assert first is again
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_generic_async_generator_wrapper_closes_request_scope(
+        self,
+    ) -> None:
+        """Test the fallback wrapper of async generator handlers."""
+
+        class TestContainer(Container):
+            @provider(scope=Scope.REQUEST)
+            async def async_resource(self) -> AsyncIterable[AsyncResource]:
+                res = AsyncResource()
+                try:
+                    yield res
+                finally:
+                    await res.aclose()
+
+        init(TestContainer)
+
+        @inject
+        async def stream(
+            _spritze_n: int, resource: Annotated[AsyncResource, Depends()]
+        ) -> AsyncIterable[AsyncResource]:
+            for _ in range(_spritze_n):
+                assert not resource.closed
+                yield resource
+
+        first, again = [resource async for resource in stream(2)]
+        assert first is again
+        assert first.closed
@@ -1,9 +1,12 @@
+import inspect
 from dataclasses import dataclass
 from typing import Annotated, Protocol, runtime_checkable
 
+import pytest
 from typing_extensions import override
 
 from spritze import Container, Depends, Scope, init, inject, provider, resolve
+from spritze.api import injection
 
 
 @dataclass
@@ -104,3 +107,148 @@ def test_resolve_resolutions() -> None:
     assert session is service_b.repo.session
     assert isinstance(service_a, ServiceA)
     assert isinstance(service_b, ServiceB)
+
+
+def test_injected_wrapper_keeps_signature_and_arguments() -> None:
+    init(ContainerFixture)
+
+    @inject
+    def handler(
+        user_id: int,
+        *args: int,
+        svc_a: Annotated[ServiceA, Depends()],
+        suffix: str = "!",
+        **kwargs: str,
+    ) -> tuple[int, str, tuple[int, ...], str, dict[str, str]]:
+        return user_id, svc_a.value, args, suffix, kwargs
+
+    assert list(inspect.signature(handler).parameters) == [
+        "user_id",
+        "args",
+        "suffix",
+        "kwargs",
+    ]
+    assert handler(1, 2, 3, extra="x") == (1, "ServiceA", (2, 3), "!", {"extra": "x"})
+
+
+def test_injected_dependency_can_be_overridden() -> None:
+    init(ContainerFixture)
+
+    override = ServiceA(RepositoryImpl(SessionImpl()))
+
+    @inject
+    def handler_kw(svc_a: Annotated[ServiceA, Depends()]) -> ServiceA:
+        return svc_a
+
+    assert handler_kw(svc_a=override) is override
+    assert handler_kw() is not override
+
+
+@pytest.mark.asyncio
+async def test_async_injected_wrapper() -> None:
+    init(ContainerFixture)
+
+    @inject
+    async def handler(
+        user_id: int, svc_b: Annotated[ServiceB, Depends()]
+    ) -> tuple[int, str]:
+        return user_id, svc_b.value
+
+    assert inspect.iscoroutinefunction(handler)
+    assert await handler(user_id=7) == (7, "ServiceB")
+
+
+def test_fallback_wrapper_with_injected_before_var_positional() -> None:
+    init(ContainerFixture)
+
+    @inject
+    def handler(
+        svc_a: Annotated[ServiceA, Depends()], *args: int
+    ) -> tuple[str, tuple[int, ...]]:
+        return svc_a.value, args
+
+    assert inspect.getfile(handler) == injection.__file__
+    assert list(inspect.signature(handler).parameters) == ["args"]
+    assert handler() == ("ServiceA", ())
+
+
+def test_fallback_wrapper_with_reserved_parameter_name() -> None:
+    init(ContainerFixture)
+
+    @inject
+    def handler(_spritze_c: int, svc_a: Annotated[ServiceA, Depends()]) -> str:
+        return f"{_spritze_c}:{svc_a.value}"
+
+    assert inspect.getfile(handler) == injection.__file__
+    assert list(inspect.signature(handler).parameters) == ["_spritze_c"]
+    assert handler(1) == "1:ServiceA"
+
+
+@pytest.mark.asyncio
+async def test_async_fallback_wrapper_with_injected_before_var_positional() -> None:
+    init(ContainerFixture)
+
+    @inject
+    async def handler(
+        svc_a: Annotated[ServiceA, Depends()], *args: int
+    ) -> tuple[str, tuple[int, ...]]:
+        return svc_a.value, args
+
+    assert inspect.getfile(handler) == injection.__file__
+    assert list(inspect.signature(handler).parameters) == ["args"]
+    assert await handler() == ("ServiceA", ())
+
+
+@pytest.mark.asyncio
+async def test_async_fallback_wrapper_with_reserved_parameter_name() -> None:
+    init(ContainerFixture)
+
+    @inject
+    async def handler(
+        _spritze_c: int,
+        svc_a: Annotated[ServiceA, Depends()],
+        svc_b: Annotated[ServiceB, Depends()],
+    ) -> str:
+        return f"{_spritze_c}:{svc_a.value}:{svc_b.value}"
+
+    assert inspect.getfile(handler) == injection.__file__
+    assert list(inspect.signature(handler).parameters) == ["_spritze_c"]
+    assert await handler(1) == "1:ServiceA:ServiceB"
+
+    override = ServiceB(
+        RepositoryImpl(SessionImpl()), ServiceA(RepositoryImpl(SessionImpl()))
+    )
+    override.value = "override"
+    assert await handler(2, svc_b=override) == "2:ServiceA:override"
+
+
+def test_request_dependency_built_once_per_request() -> None:
+    created: list[SessionProtocol] = []
+
+    class DiamondContainer(Container):
+        @provider(scope=Scope.REQUEST)
+        def session(self) -> SessionProtocol:
+            session = SessionImpl()
+            created.append(session)
+            return session
+
+        repository: object = provider(
+            RepositoryImpl, provide_as=RepositoryProtocol, scope=Scope.REQUEST
+        )
+        service_a: object = provider(ServiceA, scope=Scope.REQUEST)
+        service_b: object = provider(ServiceB, scope=Scope.REQUEST)
+
+    init(DiamondContainer)
+
+    @inject
+    def handler(
+        svc_b: Annotated[ServiceB, Depends()],
+        sess: Annotated[SessionProtocol, Depends()],
+    ) -> None:
+        assert svc_b.repo is svc_b.service_a.repo
+        assert svc_b.repo.session is sess
+
+    handler()
+    handler()
+
+    assert len(created) == 2